@@ -2,8 +2,10 @@
 FastAPI authentication & authorization dependencies.
 """
 
+from dataclasses import dataclass
 from typing import Any, Optional
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
@@ -14,7 +16,28 @@ from app.helpers.crud_user import get_user_by_email, get_user_by_id
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def get_current_user(
+@dataclass(frozen=True, slots=True)
+class UserSnapshot:
+    """Detached copy of the auth-relevant User fields, safe to cache across
+    requests (no ORM session attached). slots=True drops the per-instance
+    __dict__ — these live in a 5000-entry cache."""
+
+    user_id: int
+    email: str
+    is_active: bool
+
+
+# Short-lived cache of JWT subject -> user snapshot, so a client hammering
+# the API with one bearer token doesn't cost a DB round-trip per request.
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=30)
+
+
+def invalidate_user_cache(user_id: str) -> None:
+    """Drop a cached user snapshot (e.g. after login updates the row)."""
+    _user_cache.pop(user_id, None)
+
+
+async def get_current_user(
     session: SessionDep,
     token: str = Depends(oauth2_scheme)
 ) -> Any:
@@ -41,13 +64,23 @@ def get_current_user(
             detail="Invalid token payload",
         )
 
+    if user_id:
+        cached = _user_cache.get(user_id)
+        if cached is not None:
+            if not cached.is_active:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="User account is inactive",
+                )
+            return cached
+
     user = None
 
     if user_id:
-        user = get_user_by_id(session, user_id)
+        user = await get_user_by_id(session, user_id)
 
     if user is None and email:
-        user = get_user_by_email(session, email)
+        user = await get_user_by_email(session, email)
 
     if user is None:
         raise HTTPException(
@@ -61,4 +94,11 @@ def get_current_user(
             detail="User account is inactive",
         )
 
+    if user_id:
+        _user_cache[user_id] = UserSnapshot(
+            user_id=user.user_id,
+            email=user.email,
+            is_active=user.is_active,
+        )
+
     return user
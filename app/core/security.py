@@ -4,11 +4,18 @@ Security utilities:
 - JWT access token creation & decoding
 """
 
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta, timezone
+from functools import cache
 from typing import Any, Optional
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import orjson
+from cachetools import TTLCache
+from jwt import InvalidTokenError
+from jwt.api_jwt import PyJWT
+from jwt.exceptions import DecodeError
 
 from app.core.config import get_settings
 
@@ -18,26 +25,71 @@ settings = get_settings()
 # Password hashing
 # ---------------------------------------------------------------------
 
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-)
+# The bcrypt C extension is called directly: with a single hash scheme,
+# passlib's CryptContext only added per-call dispatch overhead on top of
+# the same underlying Blowfish key schedule. It is imported lazily so
+# process startup (serverless cold start, test collection) doesn't pay
+# for loading the extension before the first auth call needs it.
 
 
 def hash_password(password: str) -> str:
     """Hash a plaintext password."""
-    return pwd_context.hash(password)
+    import bcrypt
+
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode(), salt).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plaintext password against a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
+    import bcrypt
+
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+
+
+@cache
+def _dummy_hash() -> str:
+    """Hash of an unguessable value, built on first use (a bcrypt hash at
+    import time would slow cold start). Used to equalize login timing when
+    the email doesn't match any user (prevents user enumeration)."""
+    return hash_password("dummy-password-for-timing")
+
+
+def dummy_verify() -> None:
+    """Burn one bcrypt verification so unknown-user logins take as long
+    as wrong-password logins."""
+    verify_password("dummy-password-for-timing-mismatch", _dummy_hash())
 
 
 # ---------------------------------------------------------------------
 # JWT utilities
 # ---------------------------------------------------------------------
 
+class _OrjsonJWT(PyJWT):
+    """PyJWT with the payload (de)serialized by orjson instead of stdlib
+    json — the payload parse runs on every token decode."""
+
+    def _encode_payload(
+        self,
+        payload: dict[str, Any],
+        headers: Optional[dict[str, Any]] = None,
+        json_encoder: Any = None,
+    ) -> bytes:
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> dict[str, Any]:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as exc:
+            raise DecodeError(f"Invalid payload string: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _OrjsonJWT()
+
+
 def create_access_token(
     subject: str,
     email: Optional[str] = None,
@@ -66,22 +118,53 @@ def create_access_token(
     if email:
         payload["email"] = email
 
-    return jwt.encode(
+    return _jwt.encode(
         payload,
         settings.secret_key,
         algorithm=settings.algorithm,
     )
 
 
+# Short-lived cache of verified token payloads.
+#
+# HS256 verification (HMAC + base64 + JSON parse) runs on every authenticated
+# request; for a client reusing one bearer token this is pure repeated work.
+# A small TTL keeps the revocation blast radius to a few seconds. Invalid
+# tokens are never cached, and entries never outlive the token's own `exp`.
+_JWT_CACHE_TTL = 5
+_jwt_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_JWT_CACHE_TTL)
+_jwt_cache_lock = threading.Lock()
+
+
 def decode_access_token(token: str) -> dict[str, Any]:
     """
     Decode and validate a JWT access token.
+
+    Verified payloads are cached briefly (keyed by token hash) so repeated
+    requests with the same token skip full signature verification.
     """
+    key = hashlib.sha256(token.encode()).digest()
+
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(key)
+    if payload is not None:
+        return payload
+
     try:
-        return jwt.decode(
+        payload = _jwt.decode(
             token,
             settings.secret_key,
             algorithms=[settings.algorithm],
+            options={"require": ["exp", "iat", "sub"]},
         )
-    except JWTError as exc:
+    except InvalidTokenError as exc:
         raise ValueError("Invalid or expired token") from exc
+
+    # Never serve a token from cache past its own expiry: if `exp` lands
+    # inside the TTL window, don't cache at all.
+    exp = payload.get("exp")
+    if exp is None or exp >= time.time() + _JWT_CACHE_TTL:
+        with _jwt_cache_lock:
+            _jwt_cache[key] = payload
+
+    return payload
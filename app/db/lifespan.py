@@ -16,7 +16,8 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI) -> Any:
     """Manage database lifecycle."""
     logger.info("Creating database tables...")
-    SQLModel.metadata.create_all(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
     logger.info("Database tables created successfully")
     yield
     logger.info("Application shutdown")
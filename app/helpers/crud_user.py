@@ -1,6 +1,8 @@
 from typing import Any
 
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 
@@ -9,15 +11,19 @@ from app.db.engine import SessionDep
 from app.models.user import User
 
 
-def get_user_by_email(session: SessionDep, email: str) -> Any:
+async def get_user_by_email(session: SessionDep, email: str) -> Any:
     """Return the first user with the given email (case-insensitive)."""
     normalized = email.lower()
-    return session.exec(
-        select(User).where(User.email == normalized)
-    ).first()
+    # lower() on the column side matches rows inserted before emails were
+    # normalized at the schema layer, and the functional index keeps the
+    # lookup a seek rather than a scan
+    result = await session.exec(
+        select(User).where(func.lower(User.email) == normalized)
+    )
+    return result.first()
 
 
-def create_user(
+async def create_user(
     session: SessionDep,
     *,
     email: str,
@@ -33,9 +39,12 @@ def create_user(
     """
     normalized_email = email.strip().lower()
 
+    # bcrypt is CPU-bound for tens of milliseconds; run it off the event loop
+    hashed_password = await run_in_threadpool(hash_password, password)
+
     user = User(
         email=normalized_email,
-        hashed_password=hash_password(password),
+        hashed_password=hashed_password,
         # user_id is auto-generated
         # created_at handled by DB
     )
@@ -43,22 +52,23 @@ def create_user(
     session.add(user)
 
     try:
-        session.commit()
+        await session.commit()
     except IntegrityError:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A user with this email already exists",
         ) from None
 
-    session.refresh(user)
+    # user_id is populated by the INSERT; with expire_on_commit disabled
+    # the instance stays usable without a refresh round trip
     return user
 
 
-def get_user_by_id(session: SessionDep, user_id: str) -> Any | None:
+async def get_user_by_id(session: SessionDep, user_id: str) -> Any | None:
     """Fetch a user by primary key. Accepts UUID string or UUID instance."""
     try:
-        return session.get(User, user_id)
+        return await session.get(User, user_id)
     except Exception:
         # session.get will raise if invalid type; try returning None
         return None
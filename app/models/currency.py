@@ -16,4 +16,4 @@ class Currency(SQLModel, table=True):
     )
 
     name: str = Field(description="Full currency name")
-    is_active: bool = Field(default=True)
+    is_active: bool = Field(default=True, index=True)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pydantic import field_validator
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -25,6 +26,16 @@ class ExpenseBase(SQLModel):
 class Expense(ExpenseBase, table=True):
     """Expense table with foreign key references."""
 
+    # Every owner-scoped lookup filters on (user_id, id); the composite
+    # index resolves it with a single B-tree seek instead of an index
+    # seek plus a row check, and orders paginated listings for free.
+    # (user_id, category) plays the same role for category-filtered
+    # listings — the B-tree is the inverted index.
+    __table_args__ = (
+        Index("ix_expense_user_id_id", "user_id", "id"),
+        Index("ix_expense_user_id_category", "user_id", "category"),
+    )
+
     id: int = Field(primary_key=True, index=True)
     user_id: str = Field(foreign_key="user.user_id", index=True)
     currency_id: str = Field(foreign_key="currency.currency_id", index=True)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import Column, DateTime, Index, func, text
 from sqlmodel import Field, SQLModel
 
 
@@ -14,6 +14,12 @@ class User(SQLModel, table=True):
     - Soft-delete and activation support
     """
 
+    # Functional index so case-insensitive email lookups (and the
+    # uniqueness guarantee) don't depend on callers lowercasing first
+    __table_args__ = (
+        Index("ix_user_email_lower", text("lower(email)"), unique=True),
+    )
+
     # ------------------------------------------------------------------
     # Primary Key
     # ------------------------------------------------------------------
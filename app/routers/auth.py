@@ -1,10 +1,12 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.core.security import create_access_token, verify_password
+from app.core.dependencies import invalidate_user_cache
+from app.core.security import create_access_token, dummy_verify, verify_password
 from app.db.engine import SessionDep
 from app.helpers.crud_user import create_user, get_user_by_email
 from app.schemas.token import Token
@@ -14,7 +16,7 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
 @router.post("/register", status_code=status.HTTP_201_CREATED, response_model=UserRead)
-def register(user_in: UserCreate, session: SessionDep) -> UserRead:
+async def register(user_in: UserCreate, session: SessionDep) -> UserRead:
     """
     Register a new user.
 
@@ -30,15 +32,15 @@ def register(user_in: UserCreate, session: SessionDep) -> UserRead:
             detail="Password must be at least 8 characters long"
         )
 
-    if get_user_by_email(session, user_in.email):
+    if await get_user_by_email(session, user_in.email):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
 
-    user = create_user(session, email=user_in.email, password=user_in.password)
+    user = await create_user(session, email=user_in.email, password=user_in.password)
     return UserRead(user_id=user.user_id, email=user.email, is_active=user.is_active)
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     session: SessionDep,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ) -> dict[str, str]:
@@ -50,22 +52,45 @@ def login(
         form_data (OAuth2PasswordRequestForm): Form data containing username and password.
     """
 
-    user = get_user_by_email(session, form_data.username)
+    user = await get_user_by_email(session, form_data.username)
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user:
+        # Unknown email: still pay the hash cost so response timing
+        # doesn't reveal whether the account exists. bcrypt runs in the
+        # threadpool so the event loop keeps serving other requests.
+        await run_in_threadpool(dummy_verify)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials",
+        )
+
+    if not await run_in_threadpool(
+        verify_password, form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
 
     # ------------------------------------------------------------------
-    # Update last login timestamp (ONLY after successful auth)
+    # Update last login timestamp (ONLY after successful auth).
+    # Throttled to once per minute per user: the timestamp is telemetry,
+    # not auth state, and clients re-logging in with short-lived tokens
+    # shouldn't pay a DB write (and its fsync) on every login.
     # ------------------------------------------------------------------
-    user.last_login_at = datetime.now(timezone.utc)
-
-    session.add(user)
-    session.commit()
-    session.refresh(user)
+    now = datetime.now(timezone.utc)
+    last_login = user.last_login_at
+    if last_login is not None and last_login.tzinfo is None:
+        # SQLite hands naive datetimes back; stored values are UTC
+        last_login = last_login.replace(tzinfo=timezone.utc)
+
+    if last_login is None or (now - last_login) > timedelta(minutes=1):
+        user.last_login_at = now
+        session.add(user)
+        await session.commit()
+
+        # Drop any cached snapshot so the next request sees the fresh row
+        invalidate_user_cache(str(user.user_id))
 
     token = create_access_token(
         subject=str(user.user_id),
@@ -1,3 +1,5 @@
+from typing import Sequence
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import select
 
@@ -23,18 +25,15 @@ router = APIRouter(
     summary="Get active currencies",
     status_code=status.HTTP_200_OK,
 )
-def list_currencies(session: SessionDep) -> list[Currency]:
-    logger.info("Fetching active currencies")
-
+async def list_currencies(session: SessionDep) -> Sequence[Currency]:
+    # access logs already record the request itself; only the result
+    # count is worth a line, and only at debug on this hot read path
     statement = select(Currency).where(Currency.is_active.is_(True))
-    currencies = session.exec(statement).all()
-
-    if not currencies:
-        logger.info("No active currencies found")
-        return []
+    currencies = (await session.exec(statement)).all()
 
-    logger.info("Found %d active currencies", len(currencies))
-    return list(currencies)
+    logger.debug("Found %d active currencies", len(currencies))
+    # .all() already returns a sequence; no defensive copy needed
+    return currencies
 
 
 @router.post(
@@ -42,11 +41,12 @@ def list_currencies(session: SessionDep) -> list[Currency]:
     response_model=CurrencyResponse,
     status_code=status.HTTP_201_CREATED
 )
-def create_currency(currency_data: CurrencyCreate, session: SessionDep) -> Currency:
+async def create_currency(currency_data: CurrencyCreate, session: SessionDep) -> Currency:
     """Create a new currency."""
     # Check if currency already exists
-    existing = session.get(Currency, currency_data.currency_id)
-    logger.info(f"Checking Currency existence: {currency_data.currency_id}")
+    existing = await session.get(Currency, currency_data.currency_id)
+    # %-format so the string is only built if a handler accepts the record
+    logger.debug("Checking Currency existence: %s", currency_data.currency_id)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -60,7 +60,6 @@ def create_currency(currency_data: CurrencyCreate, session: SessionDep) -> Curre
         is_active=currency_data.is_active,
     )
     session.add(currency)
-    session.commit()
-    session.refresh(currency)
+    await session.commit()
 
     return currency
@@ -5,9 +5,14 @@ This module contains CRUD operations for expenses.
 All endpoints are protected and scoped to the authenticated user.
 """
 
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Annotated, Any
+
+import msgspec
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import raiseload
 from sqlmodel import select
 
 from app.core.dependencies import get_current_user
@@ -18,11 +23,25 @@ from app.models.user import User
 from app.schemas.expense import (
     ExpenseCreate,
     ExpenseResponse,
+    ExpenseSummaryRow,
     ExpenseUpdate,
+    _norm_category,
 )
 
 logger = get_logger(__name__)
 
+# Per-user summary rows, so dashboards polling /expenses/summary don't
+# re-run the GROUP BY on every hit. Mutations invalidate eagerly; the
+# TTL only bounds staleness across workers (same pattern as the user
+# snapshot cache in app.core.dependencies).
+_summary_cache: TTLCache = TTLCache(maxsize=5000, ttl=30)
+
+
+def _invalidate_summary(user_id: str) -> None:
+    """Drop a user's cached summary after their expenses change."""
+    _summary_cache.pop(user_id, None)
+
+
 router = APIRouter(
     prefix="/expenses",
     tags=["expenses"],
@@ -34,7 +53,44 @@ router = APIRouter(
 # ---------------------------------------------------------------------
 
 
-def get_expense_or_404(
+def expense_payload(expense: Expense) -> dict[str, Any]:
+    """Shape an ORM expense as an ExpenseResponse dict.
+
+    Rows coming out of the ORM are already typed, so re-validating them
+    through the response model is pure overhead; handlers serialize this
+    dict directly. Must stay in sync with ExpenseResponse.
+    """
+    return {
+        # int() because SQLite's RETURNING hands freshly assigned rowids
+        # back as REAL (typeof in the table is still integer)
+        "id": int(expense.id),
+        "amount": expense.amount,
+        "category": expense.category,
+        "vendor": expense.vendor,
+        "currency_id": expense.currency_id,
+    }
+
+
+class _ExpenseRow(msgspec.Struct, gc=False):
+    """msgspec mirror of ExpenseResponse for the list endpoint.
+
+    Fixed-shape C structs encode faster than dicts through orjson, and
+    gc=False keeps these transient rows out of garbage-collector
+    tracking. Must stay in sync with ExpenseResponse, like
+    expense_payload.
+    """
+
+    id: int
+    amount: float
+    category: str
+    vendor: str
+    currency_id: str
+
+
+_row_encoder = msgspec.json.Encoder()
+
+
+async def get_expense_or_404(
     session: SessionDep,
     expense_id: int,
     user_id: int,
@@ -42,14 +98,18 @@ def get_expense_or_404(
     """
     Fetch an expense owned by the given user or raise 404.
 
-    This ensures user ownership (authorization).
+    This ensures user ownership (authorization). The (user_id, id) filter
+    is resolved by a single seek on the composite index.
     """
-    expense = session.exec(
+    result = await session.exec(
         select(Expense).where(
             Expense.id == expense_id,
-            Expense.user_id == user_id,
+            # bind as text like the rest of the router; int vs varchar
+            # comparisons break outside SQLite
+            Expense.user_id == str(user_id),
         )
-    ).first()
+    )
+    expense = result.first()
 
     if not expense:
         raise HTTPException(
@@ -69,27 +129,55 @@ def get_expense_or_404(
     response_model=list[ExpenseResponse],
     summary="Get all expenses for current user",
 )
-def get_all_expenses(
+async def get_all_expenses(
     session: SessionDep,
     current_user: User = Depends(get_current_user),
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(gt=0, le=100)] = 100,
-) -> list[Expense]:
+    category: Annotated[str | None, Query()] = None,
+) -> Response:
     """
     Retrieve all expenses belonging to the authenticated user.
 
-    Supports pagination using offset and limit.
+    Supports pagination using offset and limit, and optional filtering
+    by category (categories are stored lowercased).
     """
-    logger.info("Fetching expenses for user %s", current_user.email)
-
-    expenses = list(session.exec(
+    # debug, not info: one log line per listing request is pure hot-path
+    # overhead in production
+    logger.debug("Fetching expenses for user %s", current_user.email)
+
+    # raiseload guards against latent N+1: if Expense ever grows a lazy
+    # relationship, accidental per-row loads fail loudly here instead of
+    # silently issuing N SELECTs during serialization
+    statement = (
         select(Expense)
+        .options(raiseload("*"))
         .where(Expense.user_id == str(current_user.user_id))
-        .offset(offset)
-        .limit(limit)
-    ).all())
-
-    return expenses
+    )
+
+    if category is not None:
+        # same memoized/interned normalizer the write validators use, so
+        # the filter matches stored values and stays on the
+        # (user_id, category) index
+        statement = statement.where(Expense.category == _norm_category(category))
+
+    rows = await session.exec(statement.offset(offset).limit(limit))
+
+    # Returning a Response skips response-model re-validation and the
+    # jsonable_encoder walk; the decorator's response_model still
+    # documents the schema in OpenAPI. The msgspec encoder handles the
+    # bulk listing — the hottest serialize path in the service.
+    return Response(
+        content=_row_encoder.encode(
+            [
+                # int() for the same SQLite RETURNING quirk noted in
+                # expense_payload
+                _ExpenseRow(int(e.id), e.amount, e.category, e.vendor, e.currency_id)
+                for e in rows
+            ]
+        ),
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -98,52 +186,150 @@ def get_all_expenses(
     status_code=status.HTTP_201_CREATED,
     summary="Create a new expense",
 )
-def create_expense(
+async def create_expense(
     session: SessionDep,
     expense_data: ExpenseCreate,
     current_user: User = Depends(get_current_user),
-) -> Expense:
+) -> ORJSONResponse:
     """
     Create a new expense for the authenticated user.
     """
     try:
-        expense = Expense(
-            **expense_data.model_dump(),
-            user_id=str(current_user.user_id),  # ownership enforced at creation
-        )
+        # ExpenseCreate already validated the payload; building the table
+        # model directly doesn't re-run validators (SQLModel table models
+        # skip validation on __init__), so this is a single cheap pass
+        data = expense_data.model_dump()
+        data["user_id"] = str(current_user.user_id)  # ownership enforced at creation
+        expense = Expense(**data)
         session.add(expense)
-        session.commit()
-        session.refresh(expense)
+        # The INSERT itself populates the autoincrement id, so the
+        # explicit post-commit refresh SELECT was redundant
+        await session.commit()
+        _invalidate_summary(data["user_id"])
 
         logger.info(
             "Created expense %s for user %s",
             expense.id,
             current_user.email,
         )
-        return expense
+        # direct Response: decorator status_code doesn't apply here
+        return ORJSONResponse(
+            expense_payload(expense),
+            status_code=status.HTTP_201_CREATED,
+        )
 
     except Exception:
-        session.rollback()
+        await session.rollback()
         logger.exception("Failed to create expense")
         raise
 
 
+# NOTE: must be registered before the /{expense_id} routes so "summary"
+# isn't captured as a path parameter.
+@router.get(
+    "/summary",
+    response_model=list[ExpenseSummaryRow],
+    summary="Per-category totals for current user",
+)
+async def get_expense_summary(
+    session: SessionDep,
+    current_user: User = Depends(get_current_user),
+) -> ORJSONResponse:
+    """
+    Aggregate the authenticated user's expenses per category.
+
+    The scan runs inside the database engine (one GROUP BY over the
+    (user_id, category) index) instead of iterating ORM objects in
+    Python. Results are served from a short-lived per-user cache that
+    mutations invalidate.
+    """
+    user_id = str(current_user.user_id)
+
+    rows = _summary_cache.get(user_id)
+    if rows is None:
+        result = await session.exec(
+            select(
+                Expense.category,
+                func.count(Expense.id).label("count"),
+                func.sum(Expense.amount).label("total"),
+            )
+            .where(Expense.user_id == user_id)
+            .group_by(Expense.category)
+        )
+        rows = [
+            {"category": category, "count": count, "total": total}
+            for category, count, total in result
+        ]
+        _summary_cache[user_id] = rows
+
+    return ORJSONResponse(rows)
+
+
+# NOTE: must be registered before the /{expense_id} routes so "bulk"
+# isn't captured as a path parameter.
+@router.post(
+    "/bulk",
+    response_model=list[ExpenseResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create multiple expenses",
+)
+async def create_expenses_bulk(
+    session: SessionDep,
+    expenses_data: list[ExpenseCreate],
+    current_user: User = Depends(get_current_user),
+) -> ORJSONResponse:
+    """
+    Create several expenses for the authenticated user in one statement.
+
+    Uses a single INSERT ... RETURNING instead of one round trip per row.
+    """
+    if not expenses_data:
+        return ORJSONResponse([], status_code=status.HTTP_201_CREATED)
+
+    user_id = str(current_user.user_id)
+
+    try:
+        result = await session.scalars(
+            insert(Expense).returning(Expense),
+            [d.model_dump() | {"user_id": user_id} for d in expenses_data],
+        )
+        rows = result.all()
+        await session.commit()
+        _invalidate_summary(user_id)
+
+        logger.info(
+            "Created %d expenses for user %s",
+            len(rows),
+            current_user.email,
+        )
+        return ORJSONResponse(
+            [expense_payload(e) for e in rows],
+            status_code=status.HTTP_201_CREATED,
+        )
+
+    except Exception:
+        await session.rollback()
+        logger.exception("Failed to bulk-create expenses")
+        raise
+
+
 @router.get(
     "/{expense_id}",
     response_model=ExpenseResponse,
     summary="Get expense by ID",
 )
-def get_expense(
+async def get_expense(
     session: SessionDep,
-    expense_id: int,
+    expense_id: Annotated[int, Path(ge=1)],
     current_user: User = Depends(get_current_user),
-) -> Expense:
+) -> ORJSONResponse:
     """
     Retrieve a single expense by ID.
 
     Only expenses owned by the authenticated user are accessible.
     """
-    return get_expense_or_404(session, expense_id, current_user.user_id)
+    expense = await get_expense_or_404(session, expense_id, current_user.user_id)
+    return ORJSONResponse(expense_payload(expense))
 
 
 @router.put(
@@ -151,61 +337,79 @@ def get_expense(
     response_model=ExpenseResponse,
     summary="Update an expense",
 )
-def update_expense(
+async def update_expense(
     session: SessionDep,
-    expense_id: int,
+    expense_id: Annotated[int, Path(ge=1)],
     expense_data: ExpenseUpdate,
     current_user: User = Depends(get_current_user),
-) -> Expense:
+) -> ORJSONResponse:
     """
     Update an existing expense.
 
     - Only the owner can update the expense
     - Supports partial updates
     """
-    expense = get_expense_or_404(session, expense_id, current_user.user_id)
+    update_data = expense_data.model_dump(exclude_unset=True)
 
-    try:
-        update_data = expense_data.model_dump(exclude_unset=True)
+    if not update_data:
+        # Nothing to write; still enforce existence and ownership
+        expense = await get_expense_or_404(session, expense_id, current_user.user_id)
+        return ORJSONResponse(expense_payload(expense))
 
-        for field, value in update_data.items():
-            setattr(expense, field, value)
-
-        session.add(expense)
-        session.commit()
-        session.refresh(expense)
-
-        logger.info(
-            "Updated expense %s for user %s",
-            expense_id,
-            current_user.user_id,
+    try:
+        # Single UPDATE ... RETURNING round trip: the ownership check
+        # lives in the WHERE clause, so no preliminary SELECT is needed
+        result = await session.scalars(
+            update(Expense)
+            .where(
+                Expense.id == expense_id,
+                Expense.user_id == str(current_user.user_id),
+            )
+            .values(**update_data)
+            .returning(Expense)
         )
-        return expense
+        expense = result.one_or_none()
+        await session.commit()
+        _invalidate_summary(str(current_user.user_id))
 
     except Exception:
-        session.rollback()
+        await session.rollback()
         logger.exception("Failed to update expense %s", expense_id)
         raise
 
+    if expense is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Expense not found",
+        ) from None
+
+    logger.info(
+        "Updated expense %s for user %s",
+        expense_id,
+        current_user.user_id,
+    )
+    return ORJSONResponse(expense_payload(expense))
+
 
 @router.delete(
     "/{expense_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete an expense",
 )
-def delete_expense(
+async def delete_expense(
     session: SessionDep,
-    expense_id: int,
+    expense_id: Annotated[int, Path(ge=1)],
     current_user: User = Depends(get_current_user),
 ) -> None:
     """
     Delete an expense owned by the authenticated user.
     """
-    expense = get_expense_or_404(session, expense_id, current_user.user_id)
+    expense = await get_expense_or_404(session, expense_id, current_user.user_id)
 
     try:
-        session.delete(expense)
-        session.commit()
+        await session.delete(expense)
+        await session.commit()
+        _invalidate_summary(str(current_user.user_id))
 
         logger.info(
             "Deleted expense %s for user %s",
@@ -215,6 +419,6 @@ def delete_expense(
         return None
 
     except Exception:
-        session.rollback()
+        await session.rollback()
         logger.exception("Failed to delete expense %s", expense_id)
         raise
@@ -1,6 +1,12 @@
 """Currency API schemas."""
 
-from pydantic import BaseModel
+import re
+
+from pydantic import BaseModel, field_validator
+
+# Compiled once; validating through pydantic's pattern schema would
+# re-dispatch per field instantiation
+_ISO_4217_RE = re.compile(r"^[A-Z]{3}$")
 
 
 class CurrencyCreate(BaseModel):
@@ -10,6 +16,14 @@ class CurrencyCreate(BaseModel):
     name: str
     is_active: bool = True
 
+    @field_validator("currency_id")
+    @classmethod
+    def check_iso_4217(cls, value: str) -> str:
+        """Require an uppercase three-letter ISO 4217 code."""
+        if not _ISO_4217_RE.fullmatch(value):
+            raise ValueError("currency_id must be a three-letter ISO 4217 code")
+        return value
+
     class ConfigDict:
         json_schema_extra = {
             "example": {"currency_id": "USD", "name": "US Dollar", "is_active": True}
@@ -1,7 +1,25 @@
 
+import sys
+from functools import lru_cache
+
+from pydantic import field_validator
 from sqlmodel import SQLModel
 
 
+# The normalized values are interned: categories and vendors draw from a
+# small vocabulary, so repeated values share a single str object. That
+# collapses duplicate allocations and lets later equality checks (e.g.
+# the ?category= filter) short-circuit on identity.
+@lru_cache(maxsize=1024)
+def _norm_category(value: str) -> str:
+    return sys.intern(value.strip().lower())
+
+
+@lru_cache(maxsize=1024)
+def _norm_vendor(value: str) -> str:
+    return sys.intern(value.strip())
+
+
 class ExpenseCreate(SQLModel):
     """
     Client sends currency code, not currency_id.
@@ -13,12 +31,43 @@ class ExpenseCreate(SQLModel):
     vendor: str
     currency_id: str
 
+    # Normalization must happen here: the table model skips validation on
+    # construction, so validators on ExpenseBase never run for writes.
+    # Lowercased categories are what the (user_id, category) index stores.
+    # The helpers are memoized — category and vendor values repeat
+    # heavily, so most requests skip the strip/lower allocations.
+    @field_validator("category")
+    @classmethod
+    def normalize_category(cls, value: str) -> str:
+        """Normalize category to lowercase."""
+        return _norm_category(value)
+
+    @field_validator("vendor")
+    @classmethod
+    def normalize_vendor(cls, value: str) -> str:
+        """Normalize vendor name."""
+        return _norm_vendor(value)
+
 
 class ExpenseUpdate(SQLModel):
     amount: float | None = None
     category: str | None = None
     vendor: str | None = None
-    currency: str | None = None
+    # named after the column: the update route feeds dumped fields
+    # straight into UPDATE ... SET, so a mismatched name would error
+    currency_id: str | None = None
+
+    @field_validator("category")
+    @classmethod
+    def normalize_category(cls, value: str | None) -> str | None:
+        """Normalize category to lowercase."""
+        return _norm_category(value) if value is not None else None
+
+    @field_validator("vendor")
+    @classmethod
+    def normalize_vendor(cls, value: str | None) -> str | None:
+        """Normalize vendor name."""
+        return _norm_vendor(value) if value is not None else None
 
 
 class ExpenseResponse(SQLModel):
@@ -27,3 +76,11 @@ class ExpenseResponse(SQLModel):
     category: str
     vendor: str
     currency_id: str
+
+
+class ExpenseSummaryRow(SQLModel):
+    """One per-category aggregate row from /expenses/summary."""
+
+    category: str
+    count: int
+    total: float
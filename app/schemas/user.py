@@ -1,11 +1,18 @@
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, field_validator
 
 
 class UserCreate(BaseModel):
     email: EmailStr
     password: str
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, value: str) -> str:
+        """Lowercase once at the edge so the DB layer never sees
+        mixed-case emails."""
+        return value.strip().lower()
+
 
 class UserRead(BaseModel):
     user_id: int
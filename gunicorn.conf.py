@@ -0,0 +1,12 @@
+"""Gunicorn production configuration.
+
+The Uvicorn worker picks up uvloop and httptools automatically when they
+are installed, replacing asyncio's default event loop and the pure-Python
+HTTP parser with their C implementations.
+"""
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+workers = multiprocessing.cpu_count()
+worker_class = "uvicorn.workers.UvicornWorker"
+worker_connections = 10000
@@ -0,0 +1,35 @@
+"""Shared test setup: run the suite against an isolated throwaway database.
+
+The app builds its engine at import time from Settings, so the test
+database URL must be exported before any app module is imported —
+conftest loads ahead of the test modules, which makes this the one safe
+place to do it.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+_tmpdir = tempfile.TemporaryDirectory(prefix="expense-tracker-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir.name}/test.db"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables():
+    """Create the schema once per session.
+
+    Not every test runs TestClient as a context manager, so the
+    lifespan's create_all can't be relied on for a fresh database.
+    """
+    from sqlmodel import SQLModel
+
+    from app.db.engine import engine
+    from app.main import app  # noqa: F401  (importing registers the models)
+
+    async def _init() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    asyncio.run(_init())
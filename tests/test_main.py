@@ -18,3 +18,69 @@ def test_get_all_expenses():
         assert isinstance(response.json(), list)
     finally:
         app.dependency_overrides.clear()
+
+
+def test_create_expenses_bulk():
+    app.dependency_overrides[get_current_user] = override_current_user
+    try:
+        # context manager so the lifespan runs (create_all) on a fresh DB
+        with TestClient(app) as client:
+            batch = [
+                {"amount": 9.5, "category": "Food", "vendor": "cafe", "currency_id": "USD"},
+                {"amount": 4.0, "category": "travel", "vendor": "bus", "currency_id": "USD"},
+            ]
+            response = client.post("/expenses/bulk", json=batch)
+            assert response.status_code == 201
+            rows = response.json()
+            assert len(rows) == 2
+            assert all(isinstance(row["id"], int) for row in rows)
+            assert rows[0]["category"] == "food"  # normalized on write
+            assert rows[1]["vendor"] == "bus"
+
+            for row in rows:
+                assert client.delete(f"/expenses/{row['id']}").status_code == 204
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_create_expenses_bulk_empty_list():
+    app.dependency_overrides[get_current_user] = override_current_user
+    try:
+        with TestClient(app) as client:
+            response = client.post("/expenses/bulk", json=[])
+            assert response.status_code == 201
+            assert response.json() == []
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_expense_summary_reflects_mutations():
+    # dedicated user: the exact-content asserts below must not see rows
+    # written by other tests
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(
+        user_id="summary-user", email="summary@example.com", is_active=True
+    )
+    try:
+        with TestClient(app) as client:
+            ids = [
+                client.post("/expenses/", json=payload).json()["id"]
+                for payload in (
+                    {"amount": 3.0, "category": "food", "vendor": "cafe", "currency_id": "USD"},
+                    {"amount": 7.0, "category": "travel", "vendor": "bus", "currency_id": "USD"},
+                )
+            ]
+
+            summary = {row["category"]: row for row in client.get("/expenses/summary").json()}
+            assert summary["food"] == {"category": "food", "count": 1, "total": 3.0}
+            assert summary["travel"] == {"category": "travel", "count": 1, "total": 7.0}
+
+            # deleting an expense must invalidate the cached summary
+            assert client.delete(f"/expenses/{ids[1]}").status_code == 204
+            summary = {row["category"]: row for row in client.get("/expenses/summary").json()}
+            assert "travel" not in summary
+            assert summary["food"]["total"] == 3.0
+
+            assert client.delete(f"/expenses/{ids[0]}").status_code == 204
+            assert client.get("/expenses/summary").json() == []
+    finally:
+        app.dependency_overrides.clear()